@@ -3,15 +3,65 @@
 # Python Version 2.7
 # ------------------------------------------------------------
 
-import signal
-import sys
+import os
+import threading
 import time
+import traceback
+from datetime import timedelta
+from subprocess import PIPE, Popen
 
 # Library to control the 0,96" 128x64 OLED Display
 import Adafruit_SSD1306
-import psutil as psutil
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+# monotonic clock for frame timing (falls back to wall time on Python 2)
+monotonic = getattr(time, 'monotonic', time.time)
+
+# cached systemd service states: {(service_name, ...): (timestamp, {service_name: status})}
+_service_status_cache = {}
+
+
+def _get_service_states(services, ttl):
+    """
+    Queries the status of all given services with a single systemctl call.
+    The result is cached and only refreshed after ttl seconds.
+
+    :param services: tuple of systemd service names
+    :param ttl: time in seconds a queried status is reused
+    :return: dictionary of {service_name: status} entries, status is one of "active", "in-active" or "FAILED"
+    """
+    cached = _service_status_cache.get(services)
+    if cached and monotonic() - cached[0] <= ttl:
+        return cached[1]
+
+    # errors about unknown services must not end up on the console on every refresh
+    with open(os.devnull, 'w') as devnull:
+        process = Popen(["systemctl", "show", "--property=ActiveState"] + list(services),
+                        stdout=PIPE, stderr=devnull, universal_newlines=True)
+        output = process.communicate()[0]
+
+    # systemctl prints one block of properties per service, separated by an empty line
+    states = {}
+    for service, block in zip(services, output.strip().split("\n\n")):
+        properties = dict(line.split("=", 1) for line in block.splitlines() if "=" in line)
+        active_state = properties.get("ActiveState")
+
+        if active_state == "failed":
+            states[service] = "FAILED"
+        elif active_state in ("active", "reloading"):
+            states[service] = "active"
+        else:
+            states[service] = "in-active"
+
+    _service_status_cache[services] = (monotonic(), states)
+    return states
+
 
 class DisplayController(object):
     """
@@ -20,6 +70,20 @@ class DisplayController(object):
 
     COLOR_MODE = '1'
 
+    # loading a font parses the font file, so fonts are only loaded once
+    _DEFAULT_FONT = ImageFont.load_default()
+    # {(path, size): font} of loaded TrueType fonts
+    _FONT_CACHE = {}
+
+    # time in seconds a queried service status is reused before systemctl is called again
+    SERVICE_STATUS_TTL = 5
+
+    # if more than this fraction of the screen changed the whole framebuffer is sent
+    FULL_FLUSH_RATIO = 0.75
+
+    # maximum time in seconds to wait for a cleared screen to be transmitted
+    CLEAR_TIMEOUT = 2
+
     def __init__(self, rst_pin=24):
         """
         Creates a DisplayController object
@@ -30,46 +94,84 @@ class DisplayController(object):
         # Display 128x64 display with hardware I2C:
         self._display = Adafruit_SSD1306.SSD1306_128_64(rst=rst_pin)
 
+        # the display dimensions never change
+        self._width = self._display.width
+        self._height = self._display.height
+        self._size = (self._width, self._height)
+
         # Initialize library.
         self._display.begin()
 
+        # Send only the changed area of the framebuffer in a single I2C transfer
+        # instead of the whole buffer in 16 byte chunks
+        self._prev_buffer = None
+        self._display.display = self._display_framebuffer
+
+        # {(x, y, services): (service_names, [cell, ...])} precomputed geometry of the service cells
+        self._service_layouts = {}
+
+        # the canvas is reused for every frame, so is its drawing object
         self._image = self._get_clean_canvas()
+        self._draw = ImageDraw.Draw(self._image)
+
+        # {(count, bar_width, bar_height, padding, horizontal): (owner, ramp, length, lengths)} cpu bar geometry
+        self._bar_geometry = {}
+
+        # (text, second) of the last rendered time and uptime,
+        # they only change once per second
+        self._time_cache = ("", None)
+        self._uptime_cache = ("", None)
 
         self.clear_canvas()
 
+        # {percpu: [(idle, total), ...]} cpu times of the last load reading,
+        # read once so the first frame already shows the load since startup
+        self._cpu_prev = {}
+        self._read_cpu_loads(percpu=True)
+        self._read_cpu_loads(percpu=False)
+
+        # Frames are transmitted to the display by a background thread,
+        # so the next frame can be drawn while the current one is sent.
+        # After this point only the flush worker accesses self._display.
+        self._flush_queue = queue.Queue(maxsize=1)
+        flush_thread = threading.Thread(target=self._flush_worker)
+        flush_thread.daemon = True
+        flush_thread.start()
+
     def _get_clean_canvas(self):
         """
         :return: an empty canvas to draw on that fills the entire screen 
         """
-        return Image.new(self.COLOR_MODE, (self.get_display_width(), self.get_display_height()))
+        return Image.new(self.COLOR_MODE, self._size)
 
     def clear_canvas(self, render=False):
         """
         Clears the current framebuffer
-        
+
+        The canvas is blanked in place, the image and its drawing object are never reallocated.
+
         :param render: if true renders a clear screen, otherwise only framebuffer 
         """
 
-        # Create blank image for drawing.
-        # Make sure to create image with mode '1' for 1-bit color.
-        self._image = self._get_clean_canvas()
+        self._image.paste(0, (0, 0) + self._size)
 
-        # Clear display.
-        self._display.clear()
         if render:
-            self._display.display()
+            # Clear display and wait until it is actually cleared
+            flushed = threading.Event()
+            self._queue_frame(self._get_clean_canvas(), flushed)
+            flushed.wait(self.CLEAR_TIMEOUT)
 
     def get_display_width(self):
         """
         :return: the display width in pixel 
         """
-        return self._display.width
+        return self._width
 
     def get_display_height(self):
         """
         :return: the display height in pixel 
         """
-        return self._display.height
+        return self._height
 
     def draw_rectangle(self, x, y, width, height, outline=True, fill=True):
         """
@@ -82,11 +184,8 @@ class DisplayController(object):
         :param outline: draw outline?
         :param fill: fill rectangle?
         """
-        # Get drawing object to draw on image.
-        draw = ImageDraw.Draw(self._image)
-
         # draw rectangle
-        draw.rectangle((x, y, x + width, y + height), outline=outline, fill=fill)
+        self._draw.rectangle((x, y, x + width, y + height), outline=outline, fill=fill)
 
     def draw_text(self, x, y, text, font=None, fill=True):
         """
@@ -98,14 +197,10 @@ class DisplayController(object):
         :param font: Font (incl. size)
         :param fill: Fill amount?
         """
-        if not font:
-            font = self._get_default_font()
-
-        # Get drawing object to draw on image.
-        draw = ImageDraw.Draw(self._image)
+        font = font or self._DEFAULT_FONT
 
         # Draw single line of text
-        draw.text((x, y), text, font=font, fill=fill)
+        self._draw.text((x, y), text, font=font, fill=fill)
 
     def draw_time(self, x, y, font=None, fill=True):
         """
@@ -116,7 +211,11 @@ class DisplayController(object):
         :param font: Font (incl. size)
         :param fill: 
         """
-        self.draw_text(x, y, self._get_current_time(), font=font, fill=fill)
+        now_s = int(time.time())
+        if now_s != self._time_cache[1]:
+            self._time_cache = (self._get_current_time(), now_s)
+
+        self.draw_text(x, y, self._time_cache[0], font=font, fill=fill)
 
     def draw_system_uptime(self, x, y, font=None, fill=True):
         """
@@ -128,13 +227,15 @@ class DisplayController(object):
         """
 
         def get_system_uptime():
-            from datetime import timedelta
-
             with open('/proc/uptime', 'r') as f:
                 uptime_seconds = float(f.readline().split()[0])
                 return str(timedelta(seconds=uptime_seconds))[:-7]
 
-        self.draw_text(x, y, get_system_uptime(), font=font, fill=fill)
+        now_s = int(monotonic())
+        if now_s != self._uptime_cache[1]:
+            self._uptime_cache = (get_system_uptime(), now_s)
+
+        self.draw_text(x, y, self._uptime_cache[0], font=font, fill=fill)
 
     def draw_cpu_bars(self, x, y, bar_width=1, bar_height=10, padding=2, horizontal=False, percpu=False):
         """
@@ -149,15 +250,89 @@ class DisplayController(object):
         :param percpu: render one bar per core?
         """
 
-        core_loads = psutil.cpu_percent(interval=1, percpu=percpu)
+        core_loads = self._read_cpu_loads(percpu=percpu)
+
+        owner, ramp, length, lengths = self._get_bar_geometry(len(core_loads), bar_width, bar_height, padding,
+                                                              horizontal)
+
+        # filled length of every bar in whole pixels, the last entry belongs to the padding.
+        # Multiplying before dividing keeps a load of 100% exactly at the full length.
+        lengths[:-1] = np.asarray(core_loads) * length / 100.0
+
+        # all bars as a single bitmap, one row per pixel across the bars
+        bars = ramp[np.newaxis, :] <= lengths[owner][:, np.newaxis]
+        if not horizontal:
+            bars = bars.T
+
+        height, width = bars.shape
+        image = Image.frombuffer(self.COLOR_MODE, (width, height), np.packbits(bars, axis=1).tobytes(),
+                                 'raw', self.COLOR_MODE, 0, 1)
+        self._image.paste(image, (x, y), image)
+
+    def _get_bar_geometry(self, count, bar_width, bar_height, padding, horizontal):
+        """
+        Computes the pixel layout of the cpu bars drawn by draw_cpu_bars
+
+        :param count: number of bars
+        :param bar_width: width of a single bar
+        :param bar_height: height of a single bar
+        :param padding: padding between bars in pixel
+        :param horizontal: horizontal drawing?
+        :return: tuple of the bar index of every pixel across the bars (-1 for padding),
+                 the pixel offsets along a bar, the length of a full bar
+                 and an integer array for the bar lengths ending with the padding length -1
+        """
+        key = (count, bar_width, bar_height, padding, horizontal)
+        if key not in self._bar_geometry:
+            thickness, length = (bar_height, bar_width) if horizontal else (bar_width, bar_height)
+            stride = thickness + 1 + padding
 
-        for load in core_loads:
-            if horizontal:
-                self.draw_rectangle(x, y, load / 100 * bar_width, bar_height)
-                y += bar_height + 1 + padding
+            across = np.arange(count * stride - padding)
+            owner = across // stride
+            owner[across % stride > thickness] = -1
+
+            lengths = np.empty(count + 1, dtype=int)
+            lengths[-1] = -1
+
+            self._bar_geometry[key] = (owner, np.arange(length + 1), length, lengths)
+
+        return self._bar_geometry[key]
+
+    def _read_cpu_loads(self, percpu=False):
+        """
+        Calculates the cpu load since the last call from the times in /proc/stat
+
+        :param percpu: one value per core instead of the total load?
+        :return: list of cpu loads in percent
+        """
+        with open('/proc/stat', 'rb') as f:
+            lines = f.read().splitlines()
+
+        times = []
+        # the total is on the first line followed by one line per core
+        for line in lines[1:] if percpu else lines[:1]:
+            if not line.startswith(b'cpu'):
+                break
+
+            # user, nice, system, idle, iowait, irq, softirq, steal
+            fields = [int(field) for field in line.split()[1:9]]
+            times.append((fields[3] + fields[4], sum(fields)))
+
+        previous = self._cpu_prev.get(percpu)
+        self._cpu_prev[percpu] = times
+
+        if previous is None or len(previous) != len(times):
+            return [0.0] * len(times)
+
+        loads = []
+        for (idle, total), (prev_idle, prev_total) in zip(times, previous):
+            total_delta = total - prev_total
+            if total_delta <= 0:
+                loads.append(0.0)
             else:
-                self.draw_rectangle(x, y, bar_width, load / 100 * bar_height)
-                x += bar_width + 1 + padding
+                loads.append(100.0 * (1.0 - float(idle - prev_idle) / total_delta))
+
+        return loads
 
     def draw_service_status(self, x, y, services):
         """
@@ -168,74 +343,220 @@ class DisplayController(object):
         
         :param x: X-Coordinate to start drawing from 
         :param y: Y-Coordinate to start drawing from
-        :param services: dictionary of {service_name: display_name} entries 
+        :param services: tuple of (service_name, display_name) entries,
+                         a dictionary of {service_name: display_name} entries or a list of pairs is accepted too
         """
 
-        def get_service_status(service):
-            from subprocess import call
-
-            is_active = call(["systemctl", "-q", "is-active", str(service)]) == 0
-            is_failed = call(["systemctl", "-q", "is-failed", str(service)]) == 0
+        # the layout is cached by services, so other forms are converted to a hashable tuple
+        if isinstance(services, dict):
+            services = tuple(services.items())
+        elif not isinstance(services, tuple):
+            services = tuple(tuple(entry) for entry in services)
 
-            if is_failed:
-                return "FAILED"
+        layout_key = (x, y, services)
+        layout = self._service_layouts.get(layout_key)
+        if layout is None:
+            layout = self._service_layouts[layout_key] = (tuple(service for service, _ in services),
+                                                          self._get_service_layout(x, y, services))
 
-            if is_active:
-                return "active"
-            else:
-                return "in-active"
+        service_names, cells = layout
+        states = _get_service_states(service_names, self.SERVICE_STATUS_TTL)
 
-        rect_width = 23
-        rect_height = 13
+        draw = self._draw
+        font = self._DEFAULT_FONT
 
-        for service in services:
-            status = get_service_status(service)
-            name = services[service]
+        for service, name, rect, inner_rect, text_xy in cells:
+            status = states.get(service, "in-active")
 
             if status == "FAILED":
-                self.draw_rectangle(x, y, rect_width, rect_height, fill=False)
-                self.draw_rectangle(x + 2, y + 2, rect_width - 4, rect_height - 4, fill=False)
-                self.draw_text(x + 3, y + 1, name)
+                draw.rectangle(rect, outline=True, fill=False)
+                draw.rectangle(inner_rect, outline=True, fill=False)
+                draw.text(text_xy, name, font=font, fill=True)
             elif status == "in-active":
-                self.draw_rectangle(x, y, rect_width, rect_height, fill=False)
-                self.draw_text(x + 3, y + 1, name)
+                draw.rectangle(rect, outline=True, fill=False)
+                draw.text(text_xy, name, font=font, fill=True)
             else:
                 # dont draw it
                 pass
 
+    @staticmethod
+    def _get_service_layout(x, y, services):
+        """
+        Computes the geometry of the service cells drawn by draw_service_status
+
+        :param x: X-Coordinate to start drawing from
+        :param y: Y-Coordinate to start drawing from
+        :param services: tuple of (service_name, display_name) entries
+        :return: list of (service_name, display_name, rectangle, inner rectangle, text position) tuples
+        """
+        rect_width = 23
+        rect_height = 13
+
+        layout = []
+        for service, name in services:
+            layout.append((service,
+                           name,
+                           (x, y, x + rect_width, y + rect_height),
+                           (x + 2, y + 2, x + rect_width - 2, y + rect_height - 2),
+                           (x + 3, y + 1)))
+
             x += rect_width + 2
 
+        return layout
+
+    def _display_framebuffer(self):
+        """
+        Transmits the changed area of the display framebuffer to the display.
+
+        The framebuffer is compared to the one sent last time and only the
+        bounding box of all changed bytes is transmitted.
+        If most of the screen changed the whole framebuffer is sent instead.
+        """
+        display = self._display
+        width = self._width
+        pages = display._pages
+        buffer = display._buffer
+        previous = self._prev_buffer
+
+        if previous is None:
+            first_page, last_page, first_column, last_column = 0, pages - 1, 0, width - 1
+        else:
+            dirty_pages = [page for page in range(pages)
+                           if buffer[page * width:(page + 1) * width] != previous[page * width:(page + 1) * width]]
+            if not dirty_pages:
+                return
+
+            first_page, last_page = dirty_pages[0], dirty_pages[-1]
+            dirty_columns = [index % width for index in range(first_page * width, (last_page + 1) * width)
+                             if buffer[index] != previous[index]]
+            first_column, last_column = min(dirty_columns), max(dirty_columns)
+
+            dirty_area = (last_page - first_page + 1) * (last_column - first_column + 1)
+            if dirty_area > self.FULL_FLUSH_RATIO * len(buffer):
+                first_page, last_page, first_column, last_column = 0, pages - 1, 0, width - 1
+
+        if first_column == 0 and last_column == width - 1:
+            data = buffer[first_page * width:(last_page + 1) * width]
+        else:
+            data = []
+            for page in range(first_page, last_page + 1):
+                data += buffer[page * width + first_column:page * width + last_column + 1]
+
+        self._write_window(first_column, last_column, first_page, last_page, data)
+        self._prev_buffer = list(buffer)
+
+    def _write_window(self, first_column, last_column, first_page, last_page, data):
+        """
+        Transmits display data for the given column and page window in a single I2C write.
+
+        The display is initialized in horizontal addressing mode, so after setting
+        the column and page window the data can be streamed at once.
+
+        :param first_column: first column of the window
+        :param last_column: last column of the window (inclusive)
+        :param first_page: first page of the window
+        :param last_page: last page of the window (inclusive)
+        :param data: display data for the window, page by page
+        """
+        display = self._display
+
+        display.command(Adafruit_SSD1306.SSD1306_COLUMNADDR)
+        display.command(first_column)  # Column start address
+        display.command(last_column)  # Column end address
+        display.command(Adafruit_SSD1306.SSD1306_PAGEADDR)
+        display.command(first_page)  # Page start address
+        display.command(last_page)  # Page end address
+
+        # Co = 0, DC = 1 -> the following bytes are display data
+        display._i2c.writeList(0x40, data)
+
     def render_canvas(self):
         """
         Renders the current image stored in self._image
         """
-        self._display.image(self._image)
-        self._display.display()
+        self._queue_frame(self._image.copy())
+
+    def _queue_frame(self, frame, flushed=None):
+        """
+        Hands a frame to the flush worker, replacing a frame that has not been picked up yet
+
+        :param frame: image to render
+        :param flushed: optional threading.Event that is set once the frame was handled by the flush worker
+        """
+        try:
+            self._flush_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+        self._flush_queue.put_nowait((frame, flushed))
+
+    def _flush_worker(self):
+        """
+        Transmits queued frames to the display.
+
+        A frame that fails to transmit (e.g. a transient I2C error) is reported and dropped,
+        the worker keeps running for the following frames.
+        """
+        while True:
+            frame, flushed = self._flush_queue.get()
+            try:
+                self._display._buffer[:] = self._image_to_buffer(frame)
+                self._display.display()
+            except Exception:
+                traceback.print_exc()
+            finally:
+                if flushed is not None:
+                    flushed.set()
+
+    @staticmethod
+    def _image_to_buffer(image):
+        """
+        Converts an image to the memory layout of the display.
+
+        Every byte holds a column of 8 pixels of a page with the top pixel in the least significant bit,
+        pages are stored one after another.
+
+        :param image: image to convert
+        :return: list of display memory bytes
+        """
+        pixels = np.asarray(image, dtype=np.uint8)
+        height, width = pixels.shape
+
+        # (page, column, pixel row within the page)
+        columns = pixels.reshape(height // 8, 8, width).transpose(0, 2, 1)
+
+        # packbits puts the first value into the most significant bit, so the rows are reversed
+        # (bitorder='little' would need NumPy 1.17+, which is not available for Python 2.7)
+        return np.packbits(columns[..., ::-1], axis=2).ravel().tolist()
 
     @staticmethod
     def _get_current_time():
         """
         :return: the current time 
         """
-        t = time.localtime()
-        hour, minute, second = t[3:6]
-        return str(hour).zfill(2) + ":" + str(minute).zfill(2) + ":" + str(second).zfill(2)
+        return "%02d:%02d:%02d" % time.localtime()[3:6]
 
     @staticmethod
     def _get_current_date():
         """
         :return: the current date 
         """
-        t = time.localtime()
-        year, month, day = t[0:3]
-        return str(day).zfill(2) + "." + str(month).zfill(2) + "." + str(year)
+        year, month, day = time.localtime()[0:3]
+        return "%02d.%02d.%d" % (day, month, year)
 
-    @staticmethod
-    def _get_default_font():
+    @classmethod
+    def load_font(cls, path, size):
         """
-        :return: the default font 
+        Loads a TrueType font, every font is only loaded once
+
+        :param path: path of the font file
+        :param size: font size
+        :return: the font
         """
-        return ImageFont.load_default()
+        key = (path, size)
+        if key not in cls._FONT_CACHE:
+            cls._FONT_CACHE[key] = ImageFont.truetype(path, size)
+        return cls._FONT_CACHE[key]
 
 
 """
@@ -243,62 +564,100 @@ DEMO SCRIPT
 """
 
 
-def signal_handler(signal, frame):
+def frame_clock(period):
     """
-    "CTRL+C" Handler.
-    Clears the screen when exiting the program using the ctrl+c keyboard shortcut.
-    """
-    controller.clear_canvas(True)
-    sys.exit(0)
+    Yields once every period seconds.
 
+    The next frame time is advanced by a fixed period instead of sleeping for a fixed
+    duration after each frame, so the time it takes to draw a frame does not add up to
+    a drift over time. If a frame took longer than the period the missed frames are
+    skipped instead of being rendered back to back.
 
-# register a ctrl+c handler
-signal.signal(signal.SIGINT, signal_handler)
+    On Linux with Python 3.13+ the period is enforced by a kernel timer (timerfd),
+    which wakes up with less jitter than time.sleep().
 
-# create a display controller
-controller = DisplayController()
-
-# draw to the screen indefinitely
-while True:
-    # create a new canvas
-    controller.clear_canvas()
-
-    x = 2
-    y = 2
-
-    # draw to the canvas
-
-    # controller.draw_time(x, y)
-
-    controller.draw_system_uptime(x, y)
-
-    y = 20
-    controller.draw_service_status(x, y, {
-        "nginx.service": "NGX",
-        "home-assistant.service": "HAS",
-        "grafana-server.service": "GRA",
-        "pyload.service": "PYL",
-        "raspyrfm.service": "RPY"
-    })
-
-    # font = ImageFont.truetype("font/enhanced_dot_digital-7.ttf", 12)  # font, size
-
-    # controller.draw_rectangle(0,
-    #                           y,
-    #                           controller.get_display_width() - 1,
-    #                           controller.get_display_height() - 1 - y,
-    #                           fill=False)
+    :param period: time between two frames in seconds
+    """
+    if hasattr(os, 'timerfd_create'):
+        timer = os.timerfd_create(time.CLOCK_MONOTONIC)
+        os.timerfd_settime(timer, initial=period, interval=period)
+        try:
+            while True:
+                yield
+
+                # blocks until the next tick, missed ticks are merged into a single read
+                os.read(timer, 8)
+        finally:
+            os.close(timer)
+
+    next_frame_time = monotonic()
+    while True:
+        yield
+
+        next_frame_time += period
+        delay = next_frame_time - monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            next_frame_time = monotonic()
 
-    y = 40
-    controller.draw_cpu_bars(x,
-                             y,
-                             controller.get_display_width() - 1 - 2,
-                             3,
-                             padding=1,
-                             horizontal=True,
-                             percpu=True)
 
-    # and finally render the canvas
-    controller.render_canvas()
+# create a display controller
+controller = DisplayController()
 
-    # time.sleep(0.2)
+DISPLAY_WIDTH = controller.get_display_width()
+DISPLAY_HEIGHT = controller.get_display_height()
+
+# systemd services to show as (service_name, display_name) entries
+SERVICES = (
+    ("nginx.service", "NGX"),
+    ("home-assistant.service", "HAS"),
+    ("grafana-server.service", "GRA"),
+    ("pyload.service", "PYL"),
+    ("raspyrfm.service", "RPY")
+)
+
+# time between two frames in seconds
+FRAME_PERIOD = 0.2
+
+# draw to the screen indefinitely,
+# the frame period also defines the cpu load sampling window
+try:
+    for _ in frame_clock(FRAME_PERIOD):
+        # create a new canvas
+        controller.clear_canvas()
+
+        x = 2
+        y = 2
+
+        # draw to the canvas
+
+        # controller.draw_time(x, y)
+
+        controller.draw_system_uptime(x, y)
+
+        y = 20
+        controller.draw_service_status(x, y, SERVICES)
+
+        # font = controller.load_font("font/enhanced_dot_digital-7.ttf", 12)  # font, size
+
+        # controller.draw_rectangle(0,
+        #                           y,
+        #                           DISPLAY_WIDTH - 1,
+        #                           DISPLAY_HEIGHT - 1 - y,
+        #                           fill=False)
+
+        y = 40
+        controller.draw_cpu_bars(x,
+                                 y,
+                                 DISPLAY_WIDTH - 1 - 2,
+                                 3,
+                                 padding=1,
+                                 horizontal=True,
+                                 percpu=True)
+
+        # and finally render the canvas
+        controller.render_canvas()
+except KeyboardInterrupt:
+    # clear the screen when exiting the program using the ctrl+c keyboard shortcut
+    controller.clear_canvas(True)